@@ -3,25 +3,77 @@ from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from types import MappingProxyType
+import functools
 import json
+import logging
 import os
 
+try:
+    import orjson as _json_parser
+except ImportError:
+    _json_parser = json
+
+log = logging.getLogger(__name__)
+
+
+def _freeze(value):
+    """Rend la configuration en lecture seule (dictionnaires et listes imbriqués)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class BrowserKeywords:
     
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
     
+    # Arguments Chrome : mode headless et démarrage allégé
+    _CHROME_ARGS = (
+        "--headless=new",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--window-size=1920,1080",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-translate",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-component-update",
+        "--disable-client-side-phishing-detection",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-features=Translate,BackForwardCache,OptimizationHints,MediaRouter",
+        "--metrics-recording-only",
+        "--mute-audio",
+    )
+    
+    # Stratégies de localisation résolues une seule fois
+    _BY_MAP = {
+        k: getattr(By, k)
+        for k in ("ID", "NAME", "XPATH", "CSS_SELECTOR", "CLASS_NAME",
+                  "TAG_NAME", "LINK_TEXT", "PARTIAL_LINK_TEXT")
+    }
+    
     def __init__(self):
         self.driver = None
+        self._wait = None
         self.config = self._load_config()
     
-    def _load_config(self):
-        """Charge la configuration depuis le fichier JSON"""
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_config(cls):
+        """Charge la configuration depuis le fichier JSON (une seule fois par processus)"""
         config_path = os.path.join(
             os.path.dirname(__file__), 
             '..', 'Variables', 'config.json'
         )
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            return _freeze(_json_parser.loads(f.read()))
 
     @keyword("Open Browser To URL")
     def open_browser_to_url(self, url=None):
@@ -32,21 +84,21 @@ class BrowserKeywords:
             options = webdriver.ChromeOptions()
 
             options.binary_location = "/usr/bin/chromium"
-            options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920,1080")
+            # get() rend la main au DOMContentLoaded, sans attendre les images
+            options.page_load_strategy = "eager"
+            for arg in self._CHROME_ARGS:
+                options.add_argument(arg)
 
+            # Pas d'attente implicite : les mots-clés attendent explicitement
             self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(self.config['timeouts']['default'])
+            self._wait = WebDriverWait(self.driver, self.config['timeouts']['default'])
+            # Page vide : le coût d'initialisation réseau est payé une seule fois
+            self.driver.get("about:blank")
 
+        # get() bloque déjà jusqu'au DOMContentLoaded (stratégie "eager")
         self.driver.get(url)
 
-        WebDriverWait(self.driver, self.config['timeouts']['default']).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
-
-        print(f"✓ Navigateur ouvert à : {url}")
+        log.debug("✓ Navigateur ouvert à : %s", url)
 
     @keyword("Close Browser")
     def close_browser(self):
@@ -54,7 +106,8 @@ class BrowserKeywords:
         if self.driver:
             self.driver.quit()
             self.driver = None
-            print("✓ Navigateur fermé")
+            self._wait = None
+            log.debug("✓ Navigateur fermé")
 
     @keyword("Get Current URL")
     def get_current_url(self):
@@ -64,19 +117,18 @@ class BrowserKeywords:
     @keyword("Switch To New Window")
     def switch_to_new_window(self):
         """Bascule vers la nouvelle fenêtre/onglet"""
-        # Attendre qu'il y ait au moins 2 fenêtres
-        WebDriverWait(self.driver, self.config['timeouts']['default']).until(
-            lambda d: len(d.window_handles) > 1
-        )
+        # Attendre qu'il y ait au moins 2 fenêtres ; la condition renvoie
+        # la liste déjà lue pour éviter un second aller-retour WebDriver
+        handles = self._wait.until(lambda d: (h := d.window_handles)[1:] and h)
         # Basculer vers la dernière fenêtre ouverte
-        self.driver.switch_to.window(self.driver.window_handles[-1])
-        print(f"✓ Basculé vers la nouvelle fenêtre")
+        self.driver.switch_to.window(handles[-1])
+        log.debug("✓ Basculé vers la nouvelle fenêtre")
 
     @keyword("Switch To Main Window")
     def switch_to_main_window(self):
         """Bascule vers la fenêtre principale (première fenêtre)"""
         self.driver.switch_to.window(self.driver.window_handles[0])
-        print("✓ Retour à la fenêtre principale")
+        log.debug("✓ Retour à la fenêtre principale")
 
     @keyword("Close Current Window")
     def close_current_window(self):
@@ -94,12 +146,11 @@ class BrowserKeywords:
         current_url = self.driver.current_url
         assert expected_text in current_url, \
             f"URL '{current_url}' ne contient pas '{expected_text}'"
-        print(f"✓ URL contient '{expected_text}'")
+        log.debug("✓ URL contient '%s'", expected_text)
 
     @keyword("Page Should Contain Element")
     def page_should_contain_element(self, locator_type, locator_value):
         """Vérifie que la page contient l'élément spécifié"""
-        wait = WebDriverWait(self.driver, self.config['timeouts']['default'])
-        by = getattr(By, locator_type.upper())
-        element = wait.until(EC.presence_of_element_located((by, locator_value)))
-        print(f"✓ Élément trouvé : {locator_type}={locator_value}")
\ No newline at end of file
+        by = self._BY_MAP[locator_type.upper()]
+        element = self._wait.until(EC.presence_of_element_located((by, locator_value)))
+        log.debug("✓ Élément trouvé : %s=%s", locator_type, locator_value)
\ No newline at end of file
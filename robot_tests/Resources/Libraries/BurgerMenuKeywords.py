@@ -5,13 +5,18 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException
 from robot.libraries.BuiltIn import BuiltIn
 import json
+import logging
 import os
-import time
+
+log = logging.getLogger(__name__)
 
 class BurgerMenuKeywords:
     
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
     
+    # Menu burger refermé (le conteneur reste dans le DOM, masqué)
+    _MENU_CLOSED = ".bm-menu-wrap[aria-hidden='true']"
+    
     def __init__(self):
         self.builtin = BuiltIn()
         self.selectors = self._load_selectors()
@@ -53,13 +58,16 @@ class BurgerMenuKeywords:
             
             # Si le menu est ouvert, le fermer
             if "bm-burger-button-open" in classes or driver.find_elements(By.CSS_SELECTOR, ".bm-menu-wrap[aria-hidden='false']"):
-                print("Menu déjà ouvert, fermeture...")
+                log.debug("Menu déjà ouvert, fermeture...")
                 close_button = driver.find_element(By.ID, self.selectors['burger_menu']['close_button'])
                 close_button.click()
-                time.sleep(0.5)
-                print("✓ Menu burger fermé")
+                # Attendre la fin de la fermeture plutôt qu'une pause fixe
+                WebDriverWait(driver, self.config['timeouts']['default']).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self._MENU_CLOSED))
+                )
+                log.debug("✓ Menu burger fermé")
         except (NoSuchElementException, TimeoutException):
-            print("Menu burger déjà fermé ou bouton non trouvé")
+            log.debug("Menu burger déjà fermé ou bouton non trouvé")
 
     @keyword("Open Burger Menu")
     def open_burger_menu(self):
@@ -67,8 +75,10 @@ class BurgerMenuKeywords:
         browser_lib = self._get_browser_library()
         driver = browser_lib.driver
         
-        print(f"Tentative d'ouverture du menu burger...")
-        print(f"URL actuelle: {driver.current_url}")
+        log.debug("Tentative d'ouverture du menu burger...")
+        # Lire current_url coûte un aller-retour WebDriver : seulement en debug
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("URL actuelle: %s", driver.current_url)
         
         # Fermer le menu s'il est déjà ouvert
         self.close_burger_menu()
@@ -79,38 +89,36 @@ class BurgerMenuKeywords:
             menu_button = wait.until(
                 EC.presence_of_element_located((By.ID, self.selectors['burger_menu']['menu_button']))
             )
-            print(f"✓ Bouton menu burger trouvé")
+            log.debug("✓ Bouton menu burger trouvé")
             
             # Attendre qu'il soit visible
             wait.until(EC.visibility_of(menu_button))
-            print(f"✓ Bouton menu burger visible")
+            log.debug("✓ Bouton menu burger visible")
             
-            # Scroll vers le bouton
+            # Scroll vers le bouton (le clic JavaScript n'attend pas la fin du défilement)
             driver.execute_script("arguments[0].scrollIntoView(true);", menu_button)
-            time.sleep(0.3)
             
             # Essayer de cliquer avec JavaScript directement
-            print("Clic sur le bouton menu burger...")
+            log.debug("Clic sur le bouton menu burger...")
             driver.execute_script("arguments[0].click();", menu_button)
-            time.sleep(0.5)
             
             # Attendre que le menu soit visible
             menu = wait.until(
                 EC.visibility_of_element_located((By.CLASS_NAME, self.selectors['burger_menu']['menu_container']))
             )
-            print("✓ Menu burger ouvert avec succès")
+            log.debug("✓ Menu burger ouvert avec succès")
             
         except TimeoutException as e:
-            print(f"ERREUR TimeoutException: {str(e)}")
-            print(f"Sélecteur utilisé: {self.selectors['burger_menu']['menu_button']}")
+            log.warning("ERREUR TimeoutException: %s", e)
+            log.warning("Sélecteur utilisé: %s", self.selectors['burger_menu']['menu_button'])
             # Prendre une capture d'écran pour debug
             driver.save_screenshot("debug_burger_menu_timeout.png")
-            print("Screenshot sauvegardé: debug_burger_menu_timeout.png")
+            log.warning("Screenshot sauvegardé: debug_burger_menu_timeout.png")
             raise
         except Exception as e:
-            print(f"ERREUR inattendue: {str(e)}")
+            log.warning("ERREUR inattendue: %s", e)
             driver.save_screenshot("debug_burger_menu_error.png")
-            print("Screenshot sauvegardé: debug_burger_menu_error.png")
+            log.warning("Screenshot sauvegardé: debug_burger_menu_error.png")
             raise
 
     @keyword("Verify Burger Menu Is Open")
@@ -124,7 +132,7 @@ class BurgerMenuKeywords:
             EC.visibility_of_element_located((By.CLASS_NAME, self.selectors['burger_menu']['menu_container']))
         )
         assert menu.is_displayed(), "Le menu burger n'est pas ouvert"
-        print("✓ Menu burger est bien ouvert")
+        log.debug("✓ Menu burger est bien ouvert")
 
     @keyword("Verify Burger Menu Options")
     def verify_burger_menu_options(self):
@@ -146,7 +154,7 @@ class BurgerMenuKeywords:
                 message=f"{name} n'est pas visible après l'attente"
             )
             assert element.is_displayed(), f"{name} n'est pas visible"
-            print(f"✓ Option '{name}' vérifiée")
+            log.debug("✓ Option '%s' vérifiée", name)
 
     @keyword("Add Product To Cart")
     def add_product_to_cart(self, product_name="Sauce Labs Backpack"):
@@ -168,8 +176,8 @@ class BurgerMenuKeywords:
             product_id = product_name.lower().replace(" ", "-")
             add_button_selector = f"button[data-test='add-to-cart-{product_id}']"
             
-            print(f"Recherche du produit: {product_name}")
-            print(f"Sélecteur: {add_button_selector}")
+            log.debug("Recherche du produit: %s", product_name)
+            log.debug("Sélecteur: %s", add_button_selector)
             
             add_button = wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, add_button_selector))
@@ -177,16 +185,19 @@ class BurgerMenuKeywords:
             
             # Scroll vers le bouton
             driver.execute_script("arguments[0].scrollIntoView(true);", add_button)
-            time.sleep(0.3)
             
             # Cliquer sur le bouton
             driver.execute_script("arguments[0].click();", add_button)
-            time.sleep(0.5)
             
-            print(f"✓ Produit '{product_name}' ajouté au panier")
+            # Le produit est ajouté quand son bouton devient "Remove"
+            wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, f"button[data-test='remove-{product_id}']"))
+            )
+            
+            log.debug("✓ Produit '%s' ajouté au panier", product_name)
             
         except TimeoutException:
-            print(f"ERREUR: Impossible de trouver le bouton pour '{product_name}'")
+            log.warning("ERREUR: Impossible de trouver le bouton pour '%s'", product_name)
             # driver.save_screenshot("debug_add_product_error.png")
             raise Exception(f"Le produit '{product_name}' n'a pas pu être ajouté au panier")
     
@@ -213,7 +224,7 @@ class BurgerMenuKeywords:
             assert actual_count == str(expected_count), \
                 f"Le badge affiche '{actual_count}' au lieu de '{expected_count}'"
             
-            print(f"✓ Badge du panier affiche bien {expected_count} article(s)")
+            log.debug("✓ Badge du panier affiche bien %s article(s)", expected_count)
             
         except TimeoutException:
             raise AssertionError(f"Le badge du panier n'est pas visible (attendu: {expected_count})")
@@ -245,7 +256,7 @@ class BurgerMenuKeywords:
                 button_text = add_button.text.strip().upper()
                 assert "ADD TO CART" in button_text, \
                     f"Le texte du bouton est '{button_text}' au lieu de 'ADD TO CART'"
-                print(f"✓ Le bouton 'Add to cart' est présent pour '{product_name}'")
+                log.debug("✓ Le bouton 'Add to cart' est présent pour '%s'", product_name)
             except TimeoutException:
                 # driver.save_screenshot(f"debug_add_button_missing.png")
                 raise AssertionError(f"Le bouton 'Add to cart' est introuvable pour '{product_name}'")
@@ -260,7 +271,7 @@ class BurgerMenuKeywords:
                 button_text = remove_button.text.strip().upper()
                 assert "REMOVE" in button_text, \
                     f"Le texte du bouton est '{button_text}' au lieu de 'REMOVE'"
-                print(f"✓ Le bouton 'Remove' est présent pour '{product_name}'")
+                log.debug("✓ Le bouton 'Remove' est présent pour '%s'", product_name)
             except TimeoutException:
                 # driver.save_screenshot("debug_remove_button_missing.png")
                 raise AssertionError(f"Le bouton 'Remove' est introuvable pour '{product_name}'")
@@ -282,8 +293,10 @@ class BurgerMenuKeywords:
             EC.element_to_be_clickable((By.ID, self.selectors['burger_menu']['all_items_link']))
         )
         driver.execute_script("arguments[0].click();", all_items_link)
-        time.sleep(0.5)
-        print("✓ Cliqué sur 'All Items'")
+        # Attendre la fermeture du menu (la liste des produits est déjà
+        # affichée avant le clic, elle ne synchronise rien)
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self._MENU_CLOSED)))
+        log.debug("✓ Cliqué sur 'All Items'")
         
         return current_url
 
@@ -295,7 +308,7 @@ class BurgerMenuKeywords:
         current_url = driver.current_url
         assert current_url == expected_url, \
             f"L'URL a changé : attendu '{expected_url}', obtenu '{current_url}'"
-        print(f"✓ Resté sur la même page : {current_url}")
+        log.debug("✓ Resté sur la même page : %s", current_url)
 
     @keyword("Click About")
     def click_about(self):
@@ -309,7 +322,7 @@ class BurgerMenuKeywords:
             EC.element_to_be_clickable((By.ID, self.selectors['burger_menu']['about_link']))
         )
         driver.execute_script("arguments[0].click();", about_link)
-        print("✓ Cliqué sur 'About'")
+        log.debug("✓ Cliqué sur 'About'")
 
     @keyword("Verify Saucelabs Page Opened")
     def verify_saucelabs_page_opened(self):
@@ -344,7 +357,7 @@ class BurgerMenuKeywords:
                f"(domaine: {domain}, chemin: /{path})"
                                   )
         
-        print(f"✓ Page Saucelabs ouverte : {current_url}")
+        log.debug("✓ Page Saucelabs ouverte : %s", current_url)
 
     @keyword("Return To Inventory Page")
     def return_to_inventory_page(self):
@@ -354,26 +367,26 @@ class BurgerMenuKeywords:
         wait = WebDriverWait(driver, self.config['timeouts']['default'])
         
         current_url = driver.current_url
-        print(f"URL actuelle avant retour: {current_url}")
+        log.debug("URL actuelle avant retour: %s", current_url)
         
         # Vérifier le nombre de fenêtres
         window_count = len(driver.window_handles)
-        print(f"Nombre de fenêtres ouvertes: {window_count}")
+        log.debug("Nombre de fenêtres ouvertes: %s", window_count)
         
         if window_count > 1:
             # Si plusieurs fenêtres, revenir à la première (principale)
-            print("Fermeture de la fenêtre actuelle et retour à la fenêtre principale...")
+            log.debug("Fermeture de la fenêtre actuelle et retour à la fenêtre principale...")
             driver.close()
+            # switch_to.window() rend la main une fois la fenêtre active
             driver.switch_to.window(driver.window_handles[0])
-            time.sleep(1)
         
         # Vérifier l'URL actuelle
         current_url = driver.current_url
-        print(f"URL après switch: {current_url}")
+        log.debug("URL après switch: %s", current_url)
         
         # Si on n'est pas sur inventory, y naviguer
         if "inventory" not in current_url.lower():
-            print("Navigation vers la page inventory...")
+            log.debug("Navigation vers la page inventory...")
             inventory_url = f"{self.config['urls']['base_url']}/inventory.html"
             driver.get(inventory_url)
             
@@ -381,26 +394,25 @@ class BurgerMenuKeywords:
             wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, self.selectors['inventory_page']['inventory_list']))
             )
-            print(f"✓ Retour à la page inventory: {driver.current_url}")
+            log.debug("✓ Retour à la page inventory: %s", driver.current_url)
         else:
-            print("✓ Déjà sur la page inventory")
+            log.debug("✓ Déjà sur la page inventory")
         
         return driver.current_url
 
     @keyword("Click About And Return")
     def click_about_and_return(self):
         """Clique sur About, vérifie la page, et retourne automatiquement à inventory"""
-        # Cliquer sur About
+        # Cliquer sur About (la vérification attend elle-même l'URL Saucelabs)
         self.click_about()
-        time.sleep(3)
         
         # Vérifier la page Saucelabs
         try:
             self.verify_saucelabs_page_opened()
-            print("✓ Page Saucelabs vérifiée avec succès")
+            log.debug("✓ Page Saucelabs vérifiée avec succès")
         except Exception as e:
 
-            print(f"⚠ Échec de vérification de la page Saucelabs: {str(e)}")
+            log.warning("⚠ Échec de vérification de la page Saucelabs: %s", e)
         
         # Retourner automatiquement à inventory
         return self.return_to_inventory_page()
@@ -412,21 +424,20 @@ class BurgerMenuKeywords:
         Args:
             expect_success: Si False, l'échec de vérification est attendu (problem_user)
         """
-        # Cliquer sur About
+        # Cliquer sur About (la vérification attend elle-même l'URL Saucelabs)
         self.click_about()
-        time.sleep(3)
         
         # Vérifier la page Saucelabs
         verification_success = False
         try:
             self.verify_saucelabs_page_opened()
             verification_success = True
-            print("✓ Page Saucelabs vérifiée avec succès")
+            log.debug("✓ Page Saucelabs vérifiée avec succès")
         except Exception as e:
             if expect_success:
-                print(f"✗ ÉCHEC INATTENDU: {str(e)}")
+                log.warning("✗ ÉCHEC INATTENDU: %s", e)
             else:
-                print(f"✓ ÉCHEC ATTENDU (problem_user): {str(e)}")
+                log.debug("✓ ÉCHEC ATTENDU (problem_user): %s", e)
         
         # Retourner automatiquement à inventory
         final_url = self.return_to_inventory_page()
@@ -449,8 +460,11 @@ class BurgerMenuKeywords:
             EC.element_to_be_clickable((By.ID, self.selectors['burger_menu']['reset_link']))
         )
         driver.execute_script("arguments[0].click();", reset_link)
-        time.sleep(1)
-        print("✓ Cliqué sur 'Reset App State'")
+        # Attendre que le badge du panier disparaisse
+        wait.until(
+            EC.invisibility_of_element_located((By.CLASS_NAME, self.selectors['inventory_page']['cart_badge']))
+        )
+        log.debug("✓ Cliqué sur 'Reset App State'")
 
     @keyword("Verify Cart Is Empty")
     def verify_cart_is_empty(self):
@@ -466,7 +480,7 @@ class BurgerMenuKeywords:
             badge = driver.find_element(By.CLASS_NAME, self.selectors['inventory_page']['cart_badge'])
             assert not badge.is_displayed(), "Le badge du panier est toujours visible"
         except NoSuchElementException:
-            print("✓ Le panier est vide (pas de badge)")
+            log.debug("✓ Le panier est vide (pas de badge)")
 
 
     @keyword("Click Logout")
@@ -481,7 +495,7 @@ class BurgerMenuKeywords:
             EC.element_to_be_clickable((By.ID, self.selectors['burger_menu']['logout_link']))
         )
         driver.execute_script("arguments[0].click();", logout_link)
-        print("✓ Cliqué sur 'Logout'")
+        log.debug("✓ Cliqué sur 'Logout'")
 
     @keyword("Verify Saucelabs Page Opened Or Continue")
     def verify_saucelabs_page_opened_or_continue(self):
@@ -490,6 +504,6 @@ class BurgerMenuKeywords:
             self.verify_saucelabs_page_opened()
             return True
         except Exception as e:
-            print(f"⚠ La vérification de la page Saucelabs a échoué: {str(e)}")
-            print("➜ Continuation du test...")
+            log.warning("⚠ La vérification de la page Saucelabs a échoué: %s", e)
+            log.warning("➜ Continuation du test...")
             return False
\ No newline at end of file
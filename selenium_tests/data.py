@@ -1,120 +1,179 @@
 """
 MODULAR TEST CONFIGURATION
 Centralized configuration and test data for modular login and product tests.
+
+The static data lives in data.json (parsed with orjson when available); this
+module adds the environment-dependent values and the derived lookups.
+All structures are read-only: dictionaries are MappingProxyType views, lists
+are tuples, and login cases / expected products are namedtuples.
 """
 
+import functools
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+from types import MappingProxyType
+
+from selenium.webdriver.common.by import By
+
+try:
+    import orjson as _json_parser
+except ImportError:
+    _json_parser = json
+
+
+def _freeze(value, intern_strings=False):
+    """
+    Recursively convert dictionaries and lists into read-only equivalents.
+    
+    Args:
+        value: Dictionary, list or plain value
+        intern_strings (bool): Also intern string values (sys.intern), for
+                               data compared or looked up on every test
+    
+    Returns:
+        MappingProxyType, tuple or the value itself
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v, intern_strings) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v, intern_strings) for v in value)
+    if intern_strings and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _load():
+    """
+    Parse data.json (once per process).
+    
+    Returns:
+        dict: Raw test data, keyed by the module-level names below
+    """
+    return _json_parser.loads(Path(__file__).with_name("data.json").read_bytes())
+
+
+_DATA = _load()
+
+
 # ============================
 # TEST CONFIGURATION SETTINGS
 # ============================
-CONFIG = {
-    "timeouts": {
-        "implicit_wait": 5,
-        "explicit_wait_short": 3,
-        "explicit_wait_medium": 5,
-        "explicit_wait_long": 10,
-        "short_sleep": 0.5,
-        "medium_sleep": 1,
-        "long_sleep": 2,
-    },
-    "product_count": 6,               # Expected number of products
-    "screenshot_dir": "screenshots",  # Screenshot save directory
-}
+# timeouts: no fixed sleeps, every wait polls a condition and returns as
+#   soon as it holds (see functions.driver_wait)
+#     poll_interval       - seconds between condition checks (each check
+#                           is one round trip to ChromeDriver)
+#     navigation_poll_interval
+#                         - faster polling for page transitions (product
+#                           detail page and back), which complete in a
+#                           few hundred milliseconds (functions.fast_wait)
+#     default_wait        - upper bound for page/element waits
+#     explicit_wait_short - probes for elements that may be absent
+#   There is deliberately no implicit wait (the driver keeps Selenium's 0):
+#   implicit and explicit waits compound, and an implicit wait makes every
+#   "element is absent" check stall for its full duration. Wait explicitly
+#   for elements that may not be rendered yet (functions.wait_for).
+# product_count: expected number of products
+# screenshot_dir: screenshot save directory
+# screenshot_mode: failure screenshots (UTS_SCREENSHOT_MODE environment variable)
+#     "on_fail"   - PNG file in screenshot_dir for each failure
+#     "in_memory" - base64 image kept in the test report, nothing on disk
+#     "never"     - no failure screenshots
+CONFIG = _freeze({
+    **_DATA["CONFIG"],
+    "screenshot_mode": os.getenv("UTS_SCREENSHOT_MODE", "on_fail"),
+})
 
 # ============================
 # APPLICATION URLS
 # ============================
-URLS = {
-    "login": "https://www.saucedemo.com/",
-    "inventory": "https://www.saucedemo.com/inventory.html",
-}
+URLS = _freeze(_DATA["URLS"])
 
 # ============================
 # PAGE PATTERNS
 # ============================
-PAGE_PATTERNS = {
-    "inventory_page": "/inventory.html",
-    "product_detail_page": ["inventory-item.html", "?id="],
-}
+PAGE_PATTERNS = _freeze(_DATA["PAGE_PATTERNS"])
+
+# One matcher per page, compiled once: a page given several URL fragments
+# matches any of them
+PAGE_REGEXES = MappingProxyType({
+    page: re.compile("|".join(map(re.escape, (patterns,) if isinstance(patterns, str) else patterns)))
+    for page, patterns in PAGE_PATTERNS.items()
+})
 
 # ============================
 # LOGIN TEST DATA
 # ============================
-LOGIN_ERRORS = [
-    {"case": "empty_username", "username": "", "password": "secret_sauce", 
-     "expected_error": "Epic sadface: Username is required"},
-    {"case": "empty_password", "username": "standard_user", "password": "", 
-     "expected_error": "Epic sadface: Password is required"},
-    {"case": "invalid_user", "username": "wrong_user", "password": "wrong_pass", 
-     "expected_error": "Epic sadface: Username and password do not match any user in this service"},
-    {"case": "locked_out_user", "username": "locked_out_user", "password": "secret_sauce",
-     "expected_error": "Epic sadface: Sorry, this user has been locked out.", "error_contains": "locked out"},
-    {"case": "special_char_user", "username": "!@#$%^", "password": "secret_sauce",
-     "expected_error": "Epic sadface: Username and password do not match any user in this service"},
-    {"case": "valid_user", "username": "standard_user", "password": "secret_sauce",
-     "expected_error": None, "should_succeed": True},
-]
+# One login scenario; omitted fields default to no error / expected failure.
+# error_contains is an ERROR_PATTERNS key the error message must match.
+LoginCase = namedtuple(
+    "LoginCase",
+    "case username password expected_error error_contains should_succeed",
+    defaults=(None, None, False),
+)
+
+LOGIN_ERRORS = tuple(LoginCase(**case) for case in _DATA["LOGIN_ERRORS"])
+
+# Login cases indexed by their "case" name (test_login_errors.py looks
+# cases up by name instead of scanning LOGIN_ERRORS)
+LOGIN_ERRORS_BY_CASE = MappingProxyType({case.case: case for case in LOGIN_ERRORS})
+
 # ============================
 # BROWSER CONFIGURATION
 # ============================
-BROWSER_CONFIG = {
-    "default_window_size": "1920,1080",
-    "headless": True,
-    "common_args": [
-        "--no-sandbox",
-        "--disable-dev-shm-usage",
-        "--disable-gpu"
-    ],
-    "platform_specific": {
-        "linux": {
-            "binary_location": "/usr/bin/chromium-browser",
-            "extra_args": ["--headless"]
-        },
-        "win32": {
-            "binary_location": None,
-            "extra_args": ["--headless"]
-        }
-    }
-}
+# reuse_driver: one browser per session and per worker, reset between tests
+#   (pytest --fresh-browser starts one per test instead)
+# pool_size: number of browsers running at once, caps "pytest -n auto" workers
+# page_load_strategy: "eager", driver.get() returns at DOMContentLoaded
+#   (explicit waits still gate on the elements each test needs)
+# common_args: headless mode, window size and lean startup flags. Chrome only
+#   honours the last --disable-features, so there is a single one. Images are
+#   blocked (product thumbnails dominate page weight and are never inspected)
+# prefs: Chrome profile preferences (image loading disabled as well)
+# blocked_urls: third-party hosts (web fonts, analytics) blocked through the
+#   DevTools protocol, so navigations do not wait on them
+# platform_specific: only the binary differs per platform; an optional
+#   "extra_args" list is appended to common_args
+BROWSER_CONFIG = _freeze({
+    **_DATA["BROWSER_CONFIG"],
+    "pool_size": max(1, (os.cpu_count() or 2) // 2),
+})
 
 
 # ============================
 # USERS
 # ============================
-USERS = {
-    "standard": {"username": "standard_user", "password": "secret_sauce"},
-    "locked": {"username": "locked_out_user", "password": "secret_sauce", "should_fail": True},
-    "problem": {"username": "problem_user", "password": "secret_sauce"},
-    "performance": {"username": "performance_glitch_user", "password": "secret_sauce"},
-}
+USERS = _freeze(_DATA["USERS"], intern_strings=True)
 
 # ============================
 # ERROR PATTERNS
 # ============================
-ERROR_PATTERNS = {
-    "locked_out": "locked out",
-    "username_required": "username is required",
-    "password_required": "password is required",
-    "no_match": "do not match any user",
-}
+ERROR_PATTERNS = _freeze(_DATA["ERROR_PATTERNS"])
+
+# Case-insensitive matchers for ERROR_PATTERNS, compiled once
+# (no lower-cased copy of the message per assertion)
+ERROR_REGEXES = MappingProxyType({
+    key: re.compile(re.escape(pattern), re.IGNORECASE)
+    for key, pattern in ERROR_PATTERNS.items()
+})
 
 # ============================
 # PRODUCTS
 # Keyed dictionary for product data
 # ============================
-PRODUCTS = {
-    "backpack": {"name": "Sauce Labs Backpack", "price": "$29.99"},
-    "bike_light": {"name": "Sauce Labs Bike Light", "price": "$9.99"},
-    "bolt_tshirt": {"name": "Sauce Labs Bolt T-Shirt", "price": "$15.99"},
-    "fleece_jacket": {"name": "Sauce Labs Fleece Jacket", "price": "$49.99"},
-    "onesie": {"name": "Sauce Labs Onesie", "price": "$7.99"},
-    "red_tshirt": {"name": "Test.allTheThings() T-Shirt (Red)", "price": "$15.99"},
-}
+PRODUCTS = _freeze(_DATA["PRODUCTS"])
 
 # ============================
 # EXPECTED PRODUCTS
 # List for verification of inventory page
 # ============================
-EXPECTED_PRODUCTS = [{"name": p["name"], "price": p["price"]} for p in PRODUCTS.values()]
+Product = namedtuple("Product", "name price")
+
+EXPECTED_PRODUCTS = tuple(Product(**product) for product in PRODUCTS.values())
 
 # ============================
 # NAVIGATION TEST PRODUCT
@@ -130,34 +189,80 @@ DEFAULT_PRODUCT_COUNT = len(PRODUCTS)
 # ============================
 # PAGE TITLES
 # ============================
-PAGE_TITLES = {
-    "login": "Swag Labs",
-    "inventory": "Swag Labs",
-    "product_detail": "Swag Labs",
-}
+PAGE_TITLES = _freeze(_DATA["PAGE_TITLES"])
 
 # ============================
 # SELECTORS (element locators)
 # ============================
-SELECTORS = {
-    "login_page": {
-        "username_field": "user-name",
-        "password_field": "password",
-        "login_button": "login-button",
-        "error_message": "[data-test='error']",
-        "error_close_button": "error-button",
-    },
-    "inventory_page": {
-        "product_items": "inventory_item",
-        "product_name": "inventory_item_name",
-        "product_price": "inventory_item_price",
-        "product_image": ".inventory_item_img img",
-        "add_to_cart_button": "button.btn_inventory",
-    },
-    "product_detail_page": {
-        "product_detail_name": "inventory_details_name",
-        "product_detail_price": "inventory_details_price",
-        "product_detail_image": ".inventory_details_img",
-        "back_button": "back-to-products",
-    },
-}
+SELECTORS = _freeze(_DATA["SELECTORS"], intern_strings=True)
+
+# ============================
+# LOCATORS
+# Ready-made (By.CSS_SELECTOR, selector) tuples, built once at import:
+#   driver.find_element(*LOC_LOGIN_PAGE_USERNAME_FIELD)
+#   LOCATORS["login_page"]["username_field"]
+# ============================
+# Bare selectors that are class names (every other bare selector is an ID)
+_CLASS_NAME_KEYS = frozenset({
+    "error_close_button",
+    "product_items",
+    "product_name",
+    "product_price",
+    "product_detail_name",
+    "product_detail_price",
+})
+
+
+def _by(selector, key=""):
+    """
+    Turn a selector string into a CSS-selector locator tuple.
+    
+    Bare class names and IDs are prefixed here, once, so every lookup
+    goes straight to the CSS strategy.
+    
+    Args:
+        selector (str): Selector from SELECTORS
+        key (str): SELECTORS key, used to tell class names from IDs
+    
+    Returns:
+        tuple: (By.CSS_SELECTOR, selector)
+    """
+    if selector[0] in ".[#" or any(c in selector for c in " .[>:"):
+        return (By.CSS_SELECTOR, selector)
+    if key in _CLASS_NAME_KEYS:
+        return (By.CSS_SELECTOR, sys.intern(f".{selector}"))
+    return (By.CSS_SELECTOR, sys.intern(f"#{selector}"))
+
+
+LOCATORS = _freeze({
+    page: {key: _by(value, key) for key, value in page_selectors.items()}
+    for page, page_selectors in SELECTORS.items()
+})
+
+# One constant per locator, named LOC_<PAGE>_<KEY>
+_LOGIN_LOCATORS = LOCATORS["login_page"]
+LOC_LOGIN_PAGE_USERNAME_FIELD = _LOGIN_LOCATORS["username_field"]
+LOC_LOGIN_PAGE_PASSWORD_FIELD = _LOGIN_LOCATORS["password_field"]
+LOC_LOGIN_PAGE_LOGIN_BUTTON = _LOGIN_LOCATORS["login_button"]
+LOC_LOGIN_PAGE_ERROR_MESSAGE = _LOGIN_LOCATORS["error_message"]
+LOC_LOGIN_PAGE_ERROR_CLOSE_BUTTON = _LOGIN_LOCATORS["error_close_button"]
+
+_INVENTORY_LOCATORS = LOCATORS["inventory_page"]
+LOC_INVENTORY_PAGE_PRODUCT_ITEMS = _INVENTORY_LOCATORS["product_items"]
+LOC_INVENTORY_PAGE_PRODUCT_NAME = _INVENTORY_LOCATORS["product_name"]
+LOC_INVENTORY_PAGE_PRODUCT_PRICE = _INVENTORY_LOCATORS["product_price"]
+LOC_INVENTORY_PAGE_PRODUCT_IMAGE = _INVENTORY_LOCATORS["product_image"]
+LOC_INVENTORY_PAGE_ADD_TO_CART_BUTTON = _INVENTORY_LOCATORS["add_to_cart_button"]
+
+_DETAIL_LOCATORS = LOCATORS["product_detail_page"]
+LOC_PRODUCT_DETAIL_PAGE_PRODUCT_DETAIL_NAME = _DETAIL_LOCATORS["product_detail_name"]
+LOC_PRODUCT_DETAIL_PAGE_PRODUCT_DETAIL_PRICE = _DETAIL_LOCATORS["product_detail_price"]
+LOC_PRODUCT_DETAIL_PAGE_PRODUCT_DETAIL_IMAGE = _DETAIL_LOCATORS["product_detail_image"]
+LOC_PRODUCT_DETAIL_PAGE_BACK_BUTTON = _DETAIL_LOCATORS["back_button"]
+
+# ============================
+# SCREENSHOT DIRECTORY
+# Canonical screenshot location, created once at import
+# ============================
+SCREENSHOT_DIR = Path(CONFIG["screenshot_dir"])
+SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
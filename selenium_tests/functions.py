@@ -6,13 +6,273 @@ Functions are designed to be generic, reusable, and maintainable.
 
 import os
 import time
+import atexit
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException,
+    WebDriverException,
+)
 
 # Import configuration from data module
-from data import CONFIG, SELECTORS, PAGE_PATTERNS
+from data import (
+    CONFIG, PAGE_PATTERNS, SCREENSHOT_DIR, URLS,
+    LOC_INVENTORY_PAGE_ADD_TO_CART_BUTTON,
+    LOC_INVENTORY_PAGE_PRODUCT_IMAGE,
+    LOC_INVENTORY_PAGE_PRODUCT_ITEMS,
+    LOC_INVENTORY_PAGE_PRODUCT_NAME,
+    LOC_INVENTORY_PAGE_PRODUCT_PRICE,
+    LOC_LOGIN_PAGE_ERROR_CLOSE_BUTTON,
+    LOC_LOGIN_PAGE_ERROR_MESSAGE,
+    LOC_LOGIN_PAGE_LOGIN_BUTTON,
+    LOC_LOGIN_PAGE_PASSWORD_FIELD,
+    LOC_LOGIN_PAGE_USERNAME_FIELD,
+    LOC_PRODUCT_DETAIL_PAGE_BACK_BUTTON,
+    LOC_PRODUCT_DETAIL_PAGE_PRODUCT_DETAIL_NAME,
+    LOC_PRODUCT_DETAIL_PAGE_PRODUCT_DETAIL_PRICE,
+)
+
+# Module logger: debug output is dropped unless enabled (see pytest.ini)
+log = logging.getLogger(__name__)
+
+# Poll interval for waits with a custom timeout
+_POLL_INTERVAL = CONFIG["timeouts"]["poll_interval"]
+
+# Poll interval for page transition waits (see fast_wait)
+_NAVIGATION_POLL_INTERVAL = CONFIG["timeouts"]["navigation_poll_interval"]
+
+# Timeout for quick checks (error messages, element presence)
+_SHORT_WAIT = CONFIG["timeouts"]["explicit_wait_short"]
+
+# Upper bound for page/element waits without a custom timeout
+_DEFAULT_WAIT = CONFIG["timeouts"]["default_wait"]
+
+# WebDriverWait with the default timeout and poll interval bound once:
+#   WAIT_LONG(driver).until(condition)
+WAIT_LONG = functools.partial(WebDriverWait, timeout=_DEFAULT_WAIT, poll_frequency=_POLL_INTERVAL)
+
+# URL fragments of the inventory page and of a product detail page
+_INVENTORY_PATTERN = PAGE_PATTERNS["inventory_page"]
+_DETAIL_PATTERN = PAGE_PATTERNS["product_detail_page"][0]
+
+# Reusable waits built by driver_wait() and fast_wait():
+# (id(driver), timeout[, "navigation"]) -> WebDriverWait
+_wait_cache = {}
+
+# pytest-xdist worker id, empty when tests run in a single process
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "")
+
+# Background PNG writes; pending ones are flushed before the interpreter exits
+_SCREENSHOT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+atexit.register(_SCREENSHOT_EXECUTOR.shutdown, wait=True)
+
+# Reads every product row in the browser and returns its fields in one
+# WebDriver command (the LOC_* CSS selectors are passed as arguments)
+_PRODUCTS_SCRIPT = """
+const [itemSel, nameSel, priceSel, imageSel, buttonSel] = arguments;
+return Array.from(document.querySelectorAll(itemSel), (item) => {
+    const name = item.querySelector(nameSel);
+    const price = item.querySelector(priceSel);
+    const image = item.querySelector(imageSel);
+    const button = item.querySelector(buttonSel);
+    return {
+        name: name && name.innerText,
+        price: price && price.innerText,
+        image: image,
+        add_button: button,
+        name_link: name,
+        image_displayed: image && image.offsetParent !== null,
+        image_src: image && (image.getAttribute("src") || ""),
+        add_button_displayed: button && button.offsetParent !== null,
+        add_button_enabled: button && !button.disabled,
+        name_link_displayed: name && name.offsetParent !== null,
+        name_link_enabled: name && !name.disabled,
+    };
+});
+"""
+_PRODUCTS_SCRIPT_ARGS = tuple(
+    selector
+    for _, selector in (
+        LOC_INVENTORY_PAGE_PRODUCT_ITEMS,
+        LOC_INVENTORY_PAGE_PRODUCT_NAME,
+        LOC_INVENTORY_PAGE_PRODUCT_PRICE,
+        LOC_INVENTORY_PAGE_PRODUCT_IMAGE,
+        LOC_INVENTORY_PAGE_ADD_TO_CART_BUTTON,
+    )
+)
+
+# Last get_all_products() result per driver: id(driver) -> (url, products)
+_products_cache = {}
+
+
+def _xpath_class(css_class_selector):
+    """XPath predicate matching one class from a '.class' CSS selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {css_class_selector[1:]} ')"
+
+
+# Product row with the given name and price, matched in one browser-side lookup
+_PRODUCT_MATCH_XPATH = (
+    f"//*[{_xpath_class(LOC_INVENTORY_PAGE_PRODUCT_ITEMS[1])}]"
+    f"[.//*[{_xpath_class(LOC_INVENTORY_PAGE_PRODUCT_NAME[1])} and normalize-space()={{name}}]]"
+    f"[.//*[{_xpath_class(LOC_INVENTORY_PAGE_PRODUCT_PRICE[1])} and normalize-space()={{price}}]]"
+)
+
+# Fills and submits the login form, then polls for the outcome in the browser.
+# Values go through the native input setter and an "input" event so React
+# picks them up. Calls back with {error, url} once the login has an outcome,
+# or {timeout, submitted, url} at the deadline (submitted is false when the
+# form never rendered and was left untouched).
+_LOGIN_SCRIPT = """
+const [user, pass, userSel, passSel, buttonSel, errorSel, inventoryPath,
+       timeoutMs, pollMs, done] = arguments;
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+const deadline = Date.now() + timeoutMs;
+let submitted = false;
+(function poll() {
+    if (!submitted) {
+        const userField = document.querySelector(userSel);
+        const passField = document.querySelector(passSel);
+        const button = document.querySelector(buttonSel);
+        if (userField && passField && button) {
+            for (const [field, value] of [[userField, user], [passField, pass]]) {
+                setValue.call(field, value);
+                field.dispatchEvent(new Event("input", {bubbles: true}));
+            }
+            button.click();
+            submitted = true;
+        }
+    } else {
+        const error = document.querySelector(errorSel);
+        if (error) return done({error: error.innerText.trim(), url: location.href});
+        if (location.href.includes(inventoryPath)) return done({error: null, url: location.href});
+    }
+    if (Date.now() > deadline) return done({timeout: true, submitted: submitted, url: location.href});
+    setTimeout(poll, pollMs);
+})();
+"""
+_LOGIN_SCRIPT_ARGS = (
+    LOC_LOGIN_PAGE_USERNAME_FIELD[1],
+    LOC_LOGIN_PAGE_PASSWORD_FIELD[1],
+    LOC_LOGIN_PAGE_LOGIN_BUTTON[1],
+    LOC_LOGIN_PAGE_ERROR_MESSAGE[1],
+    PAGE_PATTERNS["inventory_page"],
+)
+
+# Name link of the product with the given name
+_PRODUCT_LINK_XPATH = (
+    f"//*[{_xpath_class(LOC_INVENTORY_PAGE_PRODUCT_NAME[1])} and normalize-space()={{name}}]"
+)
+
+
+def xpath_quote(text):
+    """
+    Quote a string as an XPath literal.
+    
+    XPath 1.0 has no escape sequences, so text containing both quote
+    characters is split and rebuilt with concat().
+    
+    Args:
+        text (str): Text to quote
+    
+    Returns:
+        str: XPath string expression
+    """
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+def driver_wait(driver, timeout=None):
+    """
+    Get the WebDriverWait for a driver and timeout, using the configured
+    poll interval.
+    
+    Waits hold no state between until() calls, so one instance per
+    (driver, timeout) pair is built and then reused.
+    
+    Args:
+        driver: WebDriver instance
+        timeout (int, optional): Custom timeout in seconds
+    
+    Returns:
+        WebDriverWait: Wait object, use .until(condition)
+    """
+    key = (id(driver), timeout)
+    wait = _wait_cache.get(key)
+    if wait is None:
+        if timeout is None:
+            wait = WAIT_LONG(driver)
+        else:
+            wait = WebDriverWait(driver, timeout, poll_frequency=_POLL_INTERVAL)
+        _wait_cache[key] = wait
+    return wait
+
+
+def fast_wait(driver, timeout=None):
+    """
+    Get the WebDriverWait used for page transitions.
+    
+    Same as driver_wait(), but polls every navigation_poll_interval: a
+    navigation is detected right after it completes instead of up to one
+    regular poll interval later.
+    
+    Args:
+        driver: WebDriver instance
+        timeout (int, optional): Custom timeout in seconds (default wait
+                                 when omitted)
+    
+    Returns:
+        WebDriverWait: Wait object, use .until(condition)
+    """
+    key = (id(driver), timeout, "navigation")
+    wait = _wait_cache.get(key)
+    if wait is None:
+        wait = WebDriverWait(
+            driver,
+            _DEFAULT_WAIT if timeout is None else timeout,
+            poll_frequency=_NAVIGATION_POLL_INTERVAL,
+        )
+        _wait_cache[key] = wait
+    return wait
+
+
+def clear_wait_cache(driver=None):
+    """
+    Forget the waits built by driver_wait() and fast_wait().
+    
+    Call this before quitting a driver: its id() may be reused by the
+    next driver, which must not inherit waits bound to a closed session.
+    
+    Args:
+        driver: WebDriver instance (all drivers when omitted)
+    """
+    if driver is None:
+        _wait_cache.clear()
+    else:
+        for key in [key for key in _wait_cache if key[0] == id(driver)]:
+            del _wait_cache[key]
+
+
+def narrate(logger, *lines):
+    """
+    Log test step narration as one INFO record.
+    
+    Nothing is joined or emitted unless INFO is enabled for the logger
+    (hidden by default, see pytest.ini; show it with --log-cli-level=INFO).
+    
+    Args:
+        logger (logging.Logger): Logger of the calling test module
+        *lines (str): Narration lines, one per line of the record
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join(lines))
 
 
 def login(driver, username, password):
@@ -27,22 +287,70 @@ def login(driver, username, password):
     Returns:
         None
     """
-    # Get selectors for login page
-    selectors = SELECTORS["login_page"]
+    # Wait for the login form to be rendered (the wait returns the field,
+    # so each element is looked up only once)
+    username_field = wait_for(driver, LOC_LOGIN_PAGE_USERNAME_FIELD)
     
     # Clear and enter username
-    driver.find_element(By.ID, selectors["username_field"]).clear()
-    driver.find_element(By.ID, selectors["username_field"]).send_keys(username)
+    username_field.clear()
+    username_field.send_keys(username)
     
     # Clear and enter password
-    driver.find_element(By.ID, selectors["password_field"]).clear()
-    driver.find_element(By.ID, selectors["password_field"]).send_keys(password)
+    password_field = driver.find_element(*LOC_LOGIN_PAGE_PASSWORD_FIELD)
+    password_field.clear()
+    password_field.send_keys(password)
     
     # Click login button
-    driver.find_element(By.ID, selectors["login_button"]).click()
+    driver.find_element(*LOC_LOGIN_PAGE_LOGIN_BUTTON).click()
     
     # Log action for debugging
-    print(f"Login attempted with username: '{username}'")
+    log.debug("Login attempted with username: '%s'", username)
+
+
+def login_with_script(driver, username, password, timeout=None):
+    """
+    Log in and wait for the outcome with a single asynchronous script.
+    
+    The form is filled, submitted and watched for an error message or the
+    inventory redirect inside the browser, so the whole login costs one
+    WebDriver command instead of one per field, click and poll.
+    
+    Args:
+        driver: WebDriver instance
+        username (str): Username to enter
+        password (str): Password to enter
+        timeout (int, optional): Custom timeout in seconds
+    
+    Returns:
+        dict: {"error": error text or None, "url": current URL} once the
+              login has an outcome, None if the script could not tell (the
+              caller should fall back to login() and explicit waits)
+    
+    When there is no outcome but the form may already have been submitted
+    (script error, e.g. a page unload, or a deadline after the click), the
+    login page is loaded again before returning None, so the fallback
+    starts from an empty form instead of submitting twice or waiting for
+    a form that is no longer there.
+    """
+    timeout_ms = int((_DEFAULT_WAIT if timeout is None else timeout) * 1000)
+    try:
+        result = driver.execute_async_script(
+            _LOGIN_SCRIPT, username, password, *_LOGIN_SCRIPT_ARGS,
+            timeout_ms, int(_POLL_INTERVAL * 1000),
+        )
+    except WebDriverException as e:
+        log.debug("Scripted login failed, reloading the login page: %s", e)
+        driver.get(URLS["login"])
+        return None
+    
+    if not isinstance(result, dict) or "url" not in result or result.get("timeout"):
+        log.debug("Scripted login gave no outcome: %s", result)
+        if not isinstance(result, dict) or result.get("submitted", True):
+            driver.get(URLS["login"])
+        return None
+    
+    log.debug("Login attempted with username: '%s' (scripted)", username)
+    return result
 
 
 def get_error_message(driver):
@@ -55,17 +363,28 @@ def get_error_message(driver):
     Returns:
         str: Error message text if found, None otherwise
     """
+    # Fast path: without an error element in the page there is nothing to
+    # wait for, and a displayed one can be read right away
+    elements = driver.find_elements(*LOC_LOGIN_PAGE_ERROR_MESSAGE)
+    if not elements:
+        log.debug("No error message found")
+        return None
+    if elements[0].is_displayed():
+        error_text = elements[0].text.strip()
+        log.debug("Error message found: '%s'", error_text)
+        return error_text
+    
     try:
-        # Wait for error message to be visible
-        error_element = WebDriverWait(driver, CONFIG["timeouts"]["explicit_wait_short"]).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, SELECTORS["login_page"]["error_message"]))
+        # Present but hidden: wait for error message to be visible
+        error_element = driver_wait(driver, _SHORT_WAIT).until(
+            EC.visibility_of_element_located(LOC_LOGIN_PAGE_ERROR_MESSAGE)
         )
         error_text = error_element.text.strip()
-        print(f"Error message found: '{error_text}'")
+        log.debug("Error message found: '%s'", error_text)
         return error_text
     except TimeoutException:
         # No error message found within timeout period
-        print("No error message found")
+        log.debug("No error message found")
         return None
 
 
@@ -81,16 +400,21 @@ def close_error_message(driver):
     """
     try:
         # Find and click the error close button
-        driver.find_element(By.CLASS_NAME, SELECTORS["login_page"]["error_close_button"]).click()
+        driver.find_element(*LOC_LOGIN_PAGE_ERROR_CLOSE_BUTTON).click()
         
-        # Short pause to allow UI update
-        time.sleep(CONFIG["timeouts"]["short_sleep"])
+        # Wait for the error message to disappear
+        driver_wait(driver, _SHORT_WAIT).until(
+            EC.invisibility_of_element_located(LOC_LOGIN_PAGE_ERROR_MESSAGE)
+        )
         
-        print("Error message closed successfully")
+        log.debug("Error message closed successfully")
         return True
     except NoSuchElementException:
         # Close button not found (error might not be present)
-        print("Error close button not found")
+        log.warning("Error close button not found")
+        return False
+    except TimeoutException:
+        log.warning("Error message still displayed after closing")
         return False
 
 
@@ -105,29 +429,45 @@ def is_logged_in(driver, timeout=None):
     Returns:
         bool: True if logged in (on inventory page), False otherwise
     """
-    # Use configured timeout if not specified
-    if timeout is None:
-        timeout = CONFIG["timeouts"]["explicit_wait_long"]
-    
     try:
         # Wait for URL to contain inventory page pattern
-        WebDriverWait(driver, timeout).until(
-            EC.url_contains(PAGE_PATTERNS["inventory_page"])
+        # (configured default wait if no timeout is given)
+        driver_wait(driver, timeout).until(
+            EC.url_contains(_INVENTORY_PATTERN)
         )
-        print("Login successful - on inventory page")
+        log.debug("Login successful - on inventory page")
         return True
     except TimeoutException:
         # Not redirected to inventory page within timeout
-        print("Login failed - not on inventory page")
+        log.debug("Login failed - not on inventory page")
         return False
 
 
-def get_all_products(driver):
+def clear_products_cache(driver=None):
+    """
+    Forget the products collected by get_all_products().
+    
+    Call this after any navigation that reloads the inventory page
+    without changing its URL, as the cached WebElements are then stale.
+    
+    Args:
+        driver: WebDriver instance (all drivers when omitted)
+    """
+    if driver is None:
+        _products_cache.clear()
+    else:
+        _products_cache.pop(id(driver), None)
+
+
+def get_all_products(driver, refresh=False):
     """
     Retrieve all products from the inventory page.
     
+    The result is cached per driver and reused while the URL is unchanged.
+    
     Args:
         driver: WebDriver instance
+        refresh (bool): Ignore the cached result and read the page again
     
     Returns:
         list: List of product dictionaries, each containing:
@@ -136,48 +476,44 @@ def get_all_products(driver):
             - image: Product image WebElement
             - add_button: Add to cart button WebElement
             - name_link: Product name link WebElement
+            - image_displayed, image_src, add_button_displayed,
+              add_button_enabled, name_link_displayed, name_link_enabled:
+              element states, read in the same script call (an element
+              counts as displayed when it has a non-null offsetParent)
     """
     try:
+        current_url = driver.current_url
+        cached = _products_cache.get(id(driver))
+        if not refresh and cached and cached[0] == current_url:
+            return cached[1]
+        
         # Wait for products to load on the page
-        WebDriverWait(driver, CONFIG["timeouts"]["explicit_wait_long"]).until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, SELECTORS["inventory_page"]["product_items"]))
+        driver_wait(driver).until(
+            EC.presence_of_all_elements_located(LOC_INVENTORY_PAGE_PRODUCT_ITEMS)
         )
         
-        # Short pause to ensure all elements are fully loaded
-        time.sleep(CONFIG["timeouts"]["short_sleep"])
-        
         products = []
-        selectors = SELECTORS["inventory_page"]
         
-        # Find all product item containers
-        items = driver.find_elements(By.CLASS_NAME, selectors["product_items"])
-        print(f"Found {len(items)} product items")
+        # Extract every product and its element states in a single script
+        # call instead of find_element/is_displayed round trips per product
+        items = driver.execute_script(_PRODUCTS_SCRIPT, *_PRODUCTS_SCRIPT_ARGS)
+        log.debug("Found %s product items", len(items))
         
-        # Extract information from each product
         for index, item in enumerate(items, 1):
-            try:
-                product = {
-                    'name': item.find_element(By.CLASS_NAME, selectors["product_name"]).text,
-                    'price': item.find_element(By.CLASS_NAME, selectors["product_price"]).text,
-                    'image': item.find_element(By.CSS_SELECTOR, selectors["product_image"]),
-                    'add_button': item.find_element(By.CSS_SELECTOR, selectors["add_to_cart_button"]),
-                    'name_link': item.find_element(By.CLASS_NAME, selectors["product_name"]),
-                    'index': index  # Position in the list (1-based)
-                }
-                products.append(product)
-                
-                # Log each product found (debug level)
-                # print(f"  Product {index}: {product['name']} - {product['price']}")
-                
-            except Exception as e:
-                # Skip products that can't be parsed (log error for debugging)
-                print(f"Warning: Could not parse product at index {index}: {str(e)}")
+            # Skip products that can't be parsed (log error for debugging)
+            missing = [field for field, value in item.items() if value is None]
+            if missing:
+                log.warning("Could not parse product at index %s: missing %s", index, ', '.join(missing))
                 continue
+            
+            item['index'] = index  # Position in the list (1-based)
+            products.append(item)
         
+        _products_cache[id(driver)] = (current_url, products)
         return products
         
     except Exception as e:
-        print(f"Error getting products: {str(e)}")
+        log.warning("Error getting products: %s", e)
         return []  # Return empty list on failure
 
 
@@ -193,15 +529,34 @@ def verify_product_exists(driver, product_name, expected_price):
     Returns:
         bool: True if product exists with correct price, False otherwise
     """
+    # Without products already read for this driver, let the browser do the
+    # search with one XPath lookup instead of reading every product
+    if id(driver) not in _products_cache:
+        try:
+            driver_wait(driver).until(
+                EC.presence_of_all_elements_located(LOC_INVENTORY_PAGE_PRODUCT_ITEMS)
+            )
+            xpath = _PRODUCT_MATCH_XPATH.format(
+                name=xpath_quote(product_name), price=xpath_quote(expected_price)
+            )
+            found = bool(driver.find_elements(By.XPATH, xpath))
+            log.debug("Product %s: %s - %s", 'verified' if found else 'not found', product_name, expected_price)
+            return found
+        except TimeoutException:
+            log.debug("Product not found (no products loaded): %s - %s", product_name, expected_price)
+            return False
+        except Exception as e:
+            log.debug("XPath product lookup failed, scanning all products: %s", e)
+    
     products = get_all_products(driver)
     
     # Search for product with matching name and price
     for product in products:
         if product['name'] == product_name and product['price'] == expected_price:
-            print(f"Product verified: {product_name} - {expected_price}")
+            log.debug("Product verified: %s - %s", product_name, expected_price)
             return True
     
-    print(f"Product not found: {product_name} - {expected_price}")
+    log.debug("Product not found: %s - %s", product_name, expected_price)
     return False
 
 
@@ -209,6 +564,9 @@ def click_product_by_name(driver, product_name, retry_count=2):
     """
     Click on a product by its name. Includes retry logic for flaky clicks.
     
+    The product list is read once; a retry re-finds only the clicked link
+    when the page re-rendered it.
+    
     Args:
         driver: WebDriver instance
         product_name (str): Name of the product to click
@@ -217,41 +575,54 @@ def click_product_by_name(driver, product_name, retry_count=2):
     Returns:
         bool: True if click was successful, False otherwise
     """
+    # Reuse the products already read from this page
+    link = next(
+        (product['name_link'] for product in get_all_products(driver) if product['name'] == product_name),
+        None,
+    )
+    
     for attempt in range(1, retry_count + 1):
-        print(f"Attempt {attempt}/{retry_count} to click product: {product_name}")
+        if link is None:
+            break
+        log.debug("Attempt %s/%s to click product: %s", attempt, retry_count, product_name)
         
-        products = get_all_products(driver)
-        
-        for product in products:
-            if product['name'] == product_name:
-                try:
-                    # Try standard click first
-                    product['name_link'].click()
-                    
-                    # Wait for page to respond
-                    time.sleep(CONFIG["timeouts"]["medium_sleep"])
-                    
-                    print(f"Successfully clicked product: {product_name}")
-                    return True
-                    
-                except Exception as e:
-                    print(f"Standard click failed, trying JavaScript click: {str(e)}")
-                    
-                    try:
-                        # Fall back to JavaScript click
-                        driver.execute_script("arguments[0].click();", product['name_link'])
-                        
-                        # Wait for page to respond
-                        time.sleep(CONFIG["timeouts"]["medium_sleep"])
-                        
-                        print(f"Successfully clicked product with JavaScript: {product_name}")
-                        return True
-                        
-                    except Exception as js_error:
-                        print(f"JavaScript click also failed: {str(js_error)}")
-                        # Continue to next product or retry
-    
-    print(f"Failed to click product after {retry_count} attempts: {product_name}")
+        try:
+            # Try standard click first
+            link.click()
+            
+            # Wait for the detail page (a click that did not
+            # navigate falls through to the JavaScript click)
+            fast_wait(driver).until(EC.url_contains(_DETAIL_PATTERN))
+            
+            log.debug("Successfully clicked product: %s", product_name)
+            clear_products_cache(driver)
+            return True
+            
+        except StaleElementReferenceException:
+            # The page re-rendered: look up this product's link again
+            log.debug("Product link went stale, finding it again: %s", product_name)
+            link = safe_find_element(
+                driver, By.XPATH, _PRODUCT_LINK_XPATH.format(name=xpath_quote(product_name))
+            )
+            
+        except Exception as e:
+            log.debug("Standard click failed, trying JavaScript click: %s", e)
+            
+            try:
+                # Fall back to JavaScript click
+                driver.execute_script("arguments[0].click();", link)
+                
+                # Wait for the detail page
+                fast_wait(driver).until(EC.url_contains(_DETAIL_PATTERN))
+                
+                log.debug("Successfully clicked product with JavaScript: %s", product_name)
+                clear_products_cache(driver)
+                return True
+                
+            except Exception as js_error:
+                log.warning("JavaScript click also failed: %s", js_error)
+    
+    log.warning("Failed to click product after %s attempts: %s", retry_count, product_name)
     return False
 
 
@@ -266,17 +637,18 @@ def get_product_details(driver):
         dict: Dictionary containing product name and price, None if not found
     """
     try:
-        selectors = SELECTORS["product_detail_page"]
-        
-        # Extract product details from detail page
-        name = driver.find_element(By.CLASS_NAME, selectors["product_detail_name"]).text
-        price = driver.find_element(By.CLASS_NAME, selectors["product_detail_price"]).text
+        # Extract product details from detail page (rendered after the URL
+        # change, so wait for the name first)
+        name = driver_wait(driver).until(
+            EC.presence_of_element_located(LOC_PRODUCT_DETAIL_PAGE_PRODUCT_DETAIL_NAME)
+        ).text
+        price = driver.find_element(*LOC_PRODUCT_DETAIL_PAGE_PRODUCT_DETAIL_PRICE).text
         
-        print(f"Product details retrieved: {name} - {price}")
+        log.debug("Product details retrieved: %s - %s", name, price)
         return {"name": name, "price": price}
         
-    except NoSuchElementException:
-        print("Could not find product details on current page")
+    except (NoSuchElementException, TimeoutException):
+        log.warning("Could not find product details on current page")
         return None
 
 
@@ -292,19 +664,41 @@ def go_back_to_products(driver):
     """
     try:
         # Click the back button
-        driver.find_element(By.ID, SELECTORS["product_detail_page"]["back_button"]).click()
+        driver.find_element(*LOC_PRODUCT_DETAIL_PAGE_BACK_BUTTON).click()
         
         # Wait for navigation to complete
-        time.sleep(CONFIG["timeouts"]["medium_sleep"])
+        fast_wait(driver).until(EC.url_contains(_INVENTORY_PATTERN))
+        # The inventory page was reloaded, so earlier product elements are stale
+        clear_products_cache(driver)
         
-        print("Successfully navigated back to products list")
+        log.debug("Successfully navigated back to products list")
         return True
         
     except NoSuchElementException:
-        print("Back button not found")
+        log.warning("Back button not found")
+        return False
+    except TimeoutException:
+        log.warning("Did not return to products list")
         return False
 
 
+def current_path(driver):
+    """
+    Path of the current page, without origin, query string or fragment.
+    
+    Pages identified by their path alone are compared exactly against it
+    instead of searching a fragment in the full URL. Product detail pages
+    are told apart by their "?id=" query, so they still need current_url.
+    
+    Args:
+        driver: WebDriver instance
+    
+    Returns:
+        str: location.pathname of the page (e.g. "/inventory.html")
+    """
+    return driver.execute_script("return location.pathname;")
+
+
 def is_on_inventory_page(driver):
     """
     Check if currently on the inventory page.
@@ -315,59 +709,124 @@ def is_on_inventory_page(driver):
     Returns:
         bool: True if on inventory page, False otherwise
     """
-    is_inventory = PAGE_PATTERNS["inventory_page"] in driver.current_url
-    print(f"On inventory page: {is_inventory} (URL: {driver.current_url})")
+    path = current_path(driver)
+    is_inventory = path == _INVENTORY_PATTERN
+    log.debug("On inventory page: %s (path: %s)", is_inventory, path)
     return is_inventory
 
 
+# Characters replaced in test names used as screenshot filenames
+_CLEAN_NAME_TABLE = str.maketrans({"[": "_", "]": "_", "/": "_", "\\": "_"})
+
+
+@functools.lru_cache(maxsize=None)
+def _screenshot_prefix(test_name, screenshot_type=""):
+    """
+    Directory and cleaned filename prefix for a test's screenshots.
+    
+    Memoized: the name cleaning runs once per (test_name, screenshot_type)
+    pair instead of on every capture. The directory itself is created when
+    data.py is imported (SCREENSHOT_DIR).
+    
+    Args:
+        test_name (str): Name of the test (used in filename)
+        screenshot_type (str): Type of screenshot (e.g., "fail", "success", "debug")
+    
+    Returns:
+        str: Path prefix, to be completed with a timestamp and ".png"
+    """
+    # Clean test name for use in filename
+    clean_name = test_name.translate(_CLEAN_NAME_TABLE)
+    
+    # Keep parallel workers from overwriting each other's screenshots
+    if _WORKER_ID:
+        clean_name = f"{clean_name}_{_WORKER_ID}"
+    
+    if screenshot_type:
+        clean_name = f"{clean_name}_{screenshot_type}"
+    return str(SCREENSHOT_DIR / clean_name)
+
+
+def screenshot_path(test_name, screenshot_type=""):
+    """
+    Build a unique, descriptive screenshot filename.
+    
+    Args:
+        test_name (str): Name of the test (used in filename)
+        screenshot_type (str): Type of screenshot (e.g., "fail", "success", "debug")
+    
+    Returns:
+        str: Path where the screenshot should be written
+    """
+    # Generate timestamp for unique filename
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return f"{_screenshot_prefix(test_name, screenshot_type)}_{timestamp}.png"
+
+
+def write_screenshot(filename, png):
+    """
+    Write PNG bytes to disk in the background.
+    
+    Args:
+        filename (str): Destination path (see screenshot_path)
+        png (bytes): Image from driver.get_screenshot_as_png()
+    
+    Returns:
+        Future: Completes once the file is written
+    """
+    return _SCREENSHOT_EXECUTOR.submit(Path(filename).write_bytes, png)
+
+
 def take_screenshot(driver, test_name, screenshot_type=""):
     """
     Take a screenshot and save it with a descriptive filename.
     
+    Only the capture talks to the browser; the file is written in the
+    background (see write_screenshot), so the test does not wait on disk I/O.
+    
     Args:
         driver: WebDriver instance
         test_name (str): Name of the test (used in filename)
         screenshot_type (str): Type of screenshot (e.g., "fail", "success", "debug")
     
     Returns:
-        str: Path to the saved screenshot, None if failed
+        str: Path the screenshot is being written to, None if failed
     """
     try:
-        # Create screenshots directory if it doesn't exist
-        screenshot_dir = CONFIG["screenshot_dir"]
-        if not os.path.exists(screenshot_dir):
-            os.makedirs(screenshot_dir)
-            print(f"Created directory: {screenshot_dir}")
-        
-        # Clean test name for use in filename
-        clean_name = test_name.replace("[", "_").replace("]", "_").replace("/", "_").replace("\\", "_")
-        
-        # Generate timestamp for unique filename
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        
         # Construct filename
-        if screenshot_type:
-            filename = f"{screenshot_dir}/{clean_name}_{screenshot_type}_{timestamp}.png"
-        else:
-            filename = f"{screenshot_dir}/{clean_name}_{timestamp}.png"
+        filename = screenshot_path(test_name, screenshot_type)
         
         # Take screenshot
-        driver.save_screenshot(filename)
+        png = driver.get_screenshot_as_png()
         
-        # Verify file was created
-        if os.path.exists(filename):
-            file_size = os.path.getsize(filename)
-            print(f"Screenshot saved: {filename} ({file_size} bytes)")
-            return filename
-        else:
-            print(f"Warning: Screenshot file not created: {filename}")
-            return None
+        write_screenshot(filename, png)
+        log.debug("Screenshot saved: %s (%s bytes)", filename, len(png))
+        return filename
             
     except Exception as e:
-        print(f"Error taking screenshot: {str(e)}")
+        log.warning("Error taking screenshot: %s", e)
         return None
 
 
+def wait_for(driver, locator, timeout=None):
+    """
+    Wait for an element to be present in the DOM.
+    
+    The driver has no implicit wait, so this is the way to look up an element
+    that may not be rendered yet.
+    
+    Args:
+        driver: WebDriver instance
+        locator (tuple): Selenium locator, e.g. (By.CSS_SELECTOR, "#user-name")
+        timeout (int, optional): Custom timeout in seconds
+    
+    Returns:
+        WebElement: The found element, raises TimeoutException if not found
+    """
+    wait = driver_wait(driver, _SHORT_WAIT if timeout is None else timeout)
+    return wait.until(EC.presence_of_element_located(locator))
+
+
 def wait_for_element(driver, locator_type, locator_value, timeout=None):
     """
     Generic function to wait for an element to be present and visible.
@@ -381,12 +840,7 @@ def wait_for_element(driver, locator_type, locator_value, timeout=None):
     Returns:
         WebElement: The found element, raises exception if not found
     """
-    if timeout is None:
-        timeout = CONFIG["timeouts"]["explicit_wait_short"]
-    
-    return WebDriverWait(driver, timeout).until(
-        EC.presence_of_element_located((locator_type, locator_value))
-    )
+    return wait_for(driver, (locator_type, locator_value), timeout)
 
 
 def is_element_present(driver, locator_type, locator_value, timeout=None):
@@ -397,11 +851,17 @@ def is_element_present(driver, locator_type, locator_value, timeout=None):
         driver: WebDriver instance
         locator_type (By): Selenium By locator type
         locator_value (str): Locator value
-        timeout (int, optional): Custom timeout in seconds
+        timeout (int, optional): Custom timeout in seconds, 0 to check
+            once without waiting
     
     Returns:
         bool: True if element is present, False otherwise
     """
+    # Single lookup, no polling: find_elements() returns an empty list
+    # instead of raising when nothing matches
+    if timeout == 0:
+        return bool(driver.find_elements(locator_type, locator_value))
+    
     try:
         wait_for_element(driver, locator_type, locator_value, timeout)
         return True
@@ -437,14 +897,18 @@ def refresh_page_and_wait(driver, wait_time=None):
     
     Args:
         driver: WebDriver instance
-        wait_time (int, optional): Time to wait after refresh
+        wait_time (int, optional): Maximum time to wait for the reload
     
     Returns:
         None
     """
-    if wait_time is None:
-        wait_time = CONFIG["timeouts"]["page_load"]
+    wait = driver_wait(driver, wait_time)
+    
+    # The old document goes stale once the reload has replaced it
+    old_page = driver.find_element(By.TAG_NAME, "html")
     
-    print("Refreshing page...")
+    log.debug("Refreshing page...")
     driver.refresh()
-    time.sleep(wait_time)
\ No newline at end of file
+    clear_products_cache(driver)
+    wait.until(EC.staleness_of(old_page))
+    wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
\ No newline at end of file